@@ -2,24 +2,38 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
 import os
-from dataclasses import asdict, dataclass, field
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from datetime import UTC, datetime
+from functools import cache
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Self
 
 from clang.cindex import (
     Config,
     Cursor,
     CursorKind,
+    File,
     Index,
+    SourceRange,
     Token as ClangToken,
     TranslationUnit,
     TranslationUnitLoadError,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (the `orjson` extra)
+    orjson = None
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
 # Defaults
 PROJECT_ROOT: Final = Path(__file__).resolve().parents[3]
@@ -27,12 +41,28 @@ DEFAULT_SRC: Final = PROJECT_ROOT / 'vendor' / 'zsh' / 'Src'
 DEFAULT_OUT: Final = PROJECT_ROOT / 'zsh-grammar' / 'raw-syntax.json'
 
 # The option names in Zsh source code do not have underscores
-TRACKED_OPTIONS: Final = {
-    'EXTENDEDGLOB',
-    'RCEXPANDPARAM',
-    'KSHARRAYS',
-    'SHWORDSPLIT',
-}
+TRACKED_OPTIONS: Final = frozenset(
+    {
+        'EXTENDEDGLOB',
+        'RCEXPANDPARAM',
+        'KSHARRAYS',
+        'SHWORDSPLIT',
+    }
+)
+TRACKED_OPTIONS_PATTERN: Final = re.compile(
+    rb'\b(?:%b)\b' % b'|'.join(option.encode() for option in sorted(TRACKED_OPTIONS))
+)
+
+# CursorKind members are resolved through the enum machinery on every attribute
+# access, so bind the ones compared against in the per-cursor loops once.
+FUNCTION_DECL: Final = CursorKind.FUNCTION_DECL
+ENUM_DECL: Final = CursorKind.ENUM_DECL
+ENUM_CONSTANT_DECL: Final = CursorKind.ENUM_CONSTANT_DECL
+MACRO_DEFINITION: Final = CursorKind.MACRO_DEFINITION
+TYPEDEF_DECL: Final = CursorKind.TYPEDEF_DECL
+STRUCT_DECL: Final = CursorKind.STRUCT_DECL
+UNION_DECL: Final = CursorKind.UNION_DECL
+FIELD_DECL: Final = CursorKind.FIELD_DECL
 
 
 def relpath(p: Path, base: Path) -> str:
@@ -42,6 +72,19 @@ def relpath(p: Path, base: Path) -> str:
         return str(p)
 
 
+def json_default(o: object, /) -> object:
+    if is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in fields(o)}
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+@cache
+def get_index() -> Index:
+    # One index per process; created lazily so that Config.set_library_file() has
+    # already been called (by ZshParser.create() or init_worker()).
+    return Index.create()
+
+
 def parse_one(
     index: Index, path: Path, args: list[str], base: Path
 ) -> tuple[Any | None, str | None]:
@@ -110,7 +153,7 @@ class EnumDef(BaseDef):
     def from_cursor(cls, cursor: Cursor, location: Location, /) -> Self:
         consts: list[EnumConst] = []
         for child in cursor.get_children():
-            if child.kind == CursorKind.ENUM_CONSTANT_DECL and child.spelling:
+            if child.kind == ENUM_CONSTANT_DECL and child.spelling:
                 value = getattr(child, 'enum_value', None)
                 consts.append(EnumConst(name=child.spelling, value=value))
         name = cursor.spelling
@@ -133,6 +176,29 @@ class StatsDef:
     unions: int = field(default=0)
 
 
+@dataclass(slots=True)
+class OptionOccurrencesDef:
+    # Stored as parallel columns; rows are only built when serializing
+    files: list[str] = field(default_factory=list)
+    lines: list[int] = field(default_factory=list)
+    columns: list[int] = field(default_factory=list)
+    in_functions: list[str | None] = field(default_factory=list)
+
+    def extend(self, other: OptionOccurrencesDef, /) -> None:
+        self.files.extend(other.files)
+        self.lines.extend(other.lines)
+        self.columns.extend(other.columns)
+        self.in_functions.extend(other.in_functions)
+
+    def to_json(self) -> list[dict[str, object]]:
+        return [
+            {'file': file, 'line': line, 'column': column, 'in_function': function}
+            for file, line, column, function in zip(
+                self.files, self.lines, self.columns, self.in_functions, strict=True
+            )
+        ]
+
+
 @dataclass(frozen=True, slots=True)
 class FileDef:
     path: str
@@ -221,7 +287,7 @@ class StructDef(BaseDef):
                     type=getattr(child.type, 'spelling', None),
                 )
                 for child in cursor.get_children()
-                if child.kind == CursorKind.FIELD_DECL
+                if child.kind == FIELD_DECL
             ],
             usr=cursor.get_usr() if hasattr(cursor, 'get_usr') else None,
             location=location,
@@ -232,45 +298,88 @@ class StructDef(BaseDef):
 class UnionDef(StructDef): ...
 
 
-def paths_match(tu: TranslationUnit, child: Cursor, /) -> bool:
-    # Robustly match AST child to this translation unit.
-    # Prefer comparing resolved absolute paths; fall back to basename
-    # or suffix checks when resolution fails or when TU spelling is a
-    # basename rather than a full path.
-    if child.location.file is None:
-        return False
+def name_or_location(definition: BaseDef, /) -> str:
+    return definition.name or f'{definition.location.file}:{definition.location.line}'
 
-    tu_path = Path(tu.spelling)
-    child_path = Path(str(child.location.file))
 
+def option_extents(tu: TranslationUnit, lex_starts: list[int], /) -> list[SourceRange]:
+    # Lexing a whole TU just to find the handful of tracked option names is slow
+    # (every token is a round trip into libclang), so only lex the parts of the
+    # file that mention one. Lexing has to begin somewhere a full lex would be
+    # between tokens (not inside a comment or string literal); the start of the
+    # file and of each top-level declaration are such places. Each range runs
+    # from the closest of those before a mention to the last mention before the
+    # next one.
     try:
-        # If both can be resolved, compare canonical paths first.
-        if child_path.resolve() == tu_path.resolve():
-            pass  # matched by resolved path
-        # Fall back to basename match or TU ending with filename
-        elif child_path.name != tu_path.name and not tu.spelling.endswith(
-            child_path.name
-        ):
-            return False
+        source = Path(tu.spelling).read_bytes()
+    except OSError:
+        cursor = tu.cursor
+        return [cursor.extent] if cursor is not None else []
+
+    starts = sorted({0, *lex_starts})
+    ranges: list[tuple[int, int]] = []
+    for match in TRACKED_OPTIONS_PATTERN.finditer(source):
+        start = starts[bisect_right(starts, match.start()) - 1]
+        if ranges and ranges[-1][0] == start:
+            ranges[-1] = (start, match.end())
+        else:
+            ranges.append((start, match.end()))
+
+    return [tu.get_extent(tu.spelling, offsets) for offsets in ranges]
+
+
+def paths_matcher(tu: TranslationUnit, /) -> Callable[[File | None], bool]:
+    # Robustly match AST children to this translation unit.
+    # Match on basename or suffix when the TU spelling is a basename rather than
+    # a full path; otherwise compare resolved absolute paths. A TU's children
+    # only come from a handful of files, so the (syscall-heavy) resolution is
+    # done once per TU and once per distinct child file.
+    tu_path = Path(tu.spelling)
+    try:
+        tu_resolved: Path | None = tu_path.resolve()
     except Exception:  # noqa: BLE001
-        # If resolve() fails (e.g., file missing, permission), use name/suffix checks.
-        if child_path.name != tu_path.name and not tu.spelling.endswith(
-            child_path.name
-        ):
+        tu_resolved = None
+
+    matches: dict[str, bool] = {}
+
+    def file_matches(name: str, /) -> bool:
+        child_path = Path(name)
+        if child_path.name == tu_path.name or tu.spelling.endswith(child_path.name):
+            return True
+        try:
+            return tu_resolved is not None and child_path.resolve() == tu_resolved
+        except Exception:  # noqa: BLE001
+            # If resolve() fails (e.g., file missing, permission), the name/suffix
+            # checks above are all we have.
+            return False
+
+    def paths_match(file: File | None, /) -> bool:
+        if file is None:
             return False
 
-    return True
+        name = str(file)
+        matched = matches.get(name)
+        if matched is None:
+            matched = matches[name] = file_matches(name)
+        return matched
+
+    return paths_match
 
 
 @dataclass(frozen=True, slots=True)
 class ZshParser:
+    # Arguments that do not depend on the source directory
+    STATIC_CLANG_ARGS: ClassVar[tuple[str, ...]] = (
+        '-std=c99',
+        '-DZSH_VERSION="5.9"',
+    )
+
     src_dir: Path
     clang_args: list[str]
     libclang_path: Path | None
     version: str
     verbose: bool
 
-    index: Index = field(init=False, default_factory=lambda: Index.create())
     files: list[FileDef] = field(init=False, default_factory=list)
     functions: list[FunctionDef] = field(init=False, default_factory=list)
     enums: list[EnumDef] = field(init=False, default_factory=list)
@@ -278,126 +387,232 @@ class ZshParser:
     typedefs: list[TypedefDef] = field(init=False, default_factory=list)
     structs: list[StructDef] = field(init=False, default_factory=list)
     unions: list[UnionDef] = field(init=False, default_factory=list)
-    option_occurrences: dict[str, list[dict[str, Any]]] = field(
+    option_occurrences: dict[str, OptionOccurrencesDef] = field(
         init=False,
-        default_factory=lambda: {option: [] for option in sorted(TRACKED_OPTIONS)},
+        default_factory=lambda: {
+            option: OptionOccurrencesDef() for option in sorted(TRACKED_OPTIONS)
+        },
     )
     errors: list[str] = field(init=False, default_factory=list)
 
-    def __gather(self, tu: TranslationUnit, stats: StatsDef, /) -> None:  # noqa: C901, PLR0912
-        func_ranges: list[tuple[tuple[int, int, int, int], str]] = []
+    def __gather_function(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        if cursor.spelling:
+            self.functions.append(FunctionDef.from_cursor(cursor, location))
+            stats.functions += 1
+
+    def __gather_enum(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        self.enums.append(EnumDef.from_cursor(cursor, location))
+        stats.enums += 1
+
+    def __gather_macro(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        if cursor.spelling:
+            self.macros.append(MacroDef.from_cursor(cursor, location))
+            stats.macros += 1
+
+    def __gather_typedef(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        if cursor.spelling:
+            self.typedefs.append(TypedefDef.from_cursor(cursor, location))
+            stats.typedefs += 1
+
+    def __gather_struct(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        struct = StructDef.from_cursor(cursor, location)
+        if struct.fields or struct.name:
+            self.structs.append(struct)
+            stats.structs += 1
+
+    def __gather_union(
+        self, cursor: Cursor, location: Location, stats: StatsDef, /
+    ) -> None:
+        union = UnionDef.from_cursor(cursor, location)
+        if union.fields or union.name:
+            self.unions.append(union)
+            stats.unions += 1
+
+    def __gather(self, tu: TranslationUnit, stats: StatsDef, /) -> None:
+        gatherers: dict[CursorKind, Callable[[Cursor, Location, StatsDef], None]] = {
+            FUNCTION_DECL: self.__gather_function,
+            ENUM_DECL: self.__gather_enum,
+            MACRO_DEFINITION: self.__gather_macro,
+            TYPEDEF_DECL: self.__gather_typedef,
+            STRUCT_DECL: self.__gather_struct,
+            UNION_DECL: self.__gather_union,
+        }
+        func_ranges: list[tuple[tuple[int, int], tuple[int, int], str]] = []
+        lex_starts: list[int] = []
+
+        # Nearly every location in a TU points at the same file, so compute each
+        # relative path once rather than once per declaration and per token.
+        rel_files: dict[str, str] = {}
+
+        def rel_file(name: str) -> str:
+            rel = rel_files.get(name)
+            if rel is None:
+                rel = rel_files[name] = relpath(Path(name), self.src_dir)
+            return rel
+
+        paths_match = paths_matcher(tu)
 
         cursor = tu.cursor
         if cursor is not None:
             for child in cursor.get_children():
-                if not paths_match(tu, child):
+                # Cursor.kind is a libclang call, so read it once and drop the
+                # (many) uninteresting children before any path matching.
+                kind = child.kind
+                gather = gatherers.get(kind)
+                if gather is None:
                     continue
 
                 loc = child.location
-                file = Path(str(loc.file)) if loc.file else Path('<unknown>')
-                location = Location(
-                    file=relpath(file, self.src_dir),
-                    line=loc.line or 0,
-                    column=loc.column or 0,
-                )
+                if not paths_match(loc.file):
+                    continue
 
-                if child.kind == CursorKind.FUNCTION_DECL and child.is_definition():
-                    if child.spelling:
-                        self.functions.append(FunctionDef.from_cursor(child, location))
-                        stats.functions += 1
+                extent = child.extent
+                lex_starts.append(extent.start.offset)
+
+                if kind == FUNCTION_DECL:
+                    if not child.is_definition():
+                        continue
 
                     func_ranges.append(
                         (
-                            (
-                                child.extent.start.line,
-                                child.extent.start.column,
-                                child.extent.end.line,
-                                child.extent.end.column,
-                            ),
+                            (extent.start.line, extent.start.column),
+                            (extent.end.line, extent.end.column),
                             child.spelling,
                         )
                     )
 
-                elif child.kind == CursorKind.ENUM_DECL:
-                    self.enums.append(EnumDef.from_cursor(child, location))
-                    stats.enums += 1
-
-                elif child.kind == CursorKind.MACRO_DEFINITION and child.spelling:
-                    self.macros.append(MacroDef.from_cursor(child, location))
-                    stats.macros += 1
-
-                elif child.kind == CursorKind.TYPEDEF_DECL and child.spelling:
-                    self.typedefs.append(TypedefDef.from_cursor(child, location))
-                    stats.typedefs += 1
-
-                elif child.kind == CursorKind.STRUCT_DECL:
-                    struct = StructDef.from_cursor(child, location)
-                    if struct.fields or struct.name:
-                        self.structs.append(struct)
-                        stats.structs += 1
+                gather(
+                    child,
+                    Location(
+                        file=rel_file(str(loc.file) if loc.file else '<unknown>'),
+                        line=loc.line or 0,
+                        column=loc.column or 0,
+                    ),
+                    stats,
+                )
 
-                elif child.kind == CursorKind.UNION_DECL:
-                    union = UnionDef.from_cursor(child, location)
-                    if union.fields or union.name:
-                        self.unions.append(union)
-                        stats.unions += 1
+            func_ranges.sort(key=lambda func_range: func_range[0])
+            func_starts = [start for start, _, _ in func_ranges]
 
             try:
 
                 def enclosing_func(line: int, col: int) -> str | None:
-                    for (sl, sc, el, ec), nm in func_ranges:
-                        if (line > sl or (line == sl and col >= sc)) and (
-                            line < el or (line == el and col <= ec)
-                        ):
-                            return nm
+                    # C functions cannot nest, so the only candidate is the last
+                    # function starting at or before this position.
+                    position = (line, col)
+                    index = bisect_right(func_starts, position) - 1
+                    if index >= 0 and position <= func_ranges[index][1]:
+                        return func_ranges[index][2]
                     return None
 
-                for token in tu.get_tokens(extent=cursor.extent):
-                    if token.spelling in TRACKED_OPTIONS:
-                        loc = Location(
-                            file=relpath(Path(str(token.location.file)), self.src_dir),
-                            line=token.location.line,
-                            column=token.location.column,
-                        )
-                        self.option_occurrences.setdefault(token.spelling, []).append(
-                            {
-                                'file': loc.file,
-                                'line': loc.line,
-                                'column': loc.column,
-                                'in_function': enclosing_func(
-                                    token.location.line, token.location.column
-                                ),
-                            }
-                        )
+                tokens = (
+                    token
+                    for extent in option_extents(tu, lex_starts)
+                    for token in tu.get_tokens(extent=extent)
+                )
+                for token in tokens:
+                    # Token.spelling and Token.location each call into libclang
+                    # and build a new object, so fetch them once per token.
+                    spelling = token.spelling
+                    if spelling in TRACKED_OPTIONS:
+                        token_loc = token.location
+                        line = token_loc.line
+                        column = token_loc.column
+                        occurrences = self.option_occurrences[spelling]
+                        occurrences.files.append(rel_file(str(token_loc.file)))
+                        occurrences.lines.append(line)
+                        occurrences.columns.append(column)
+                        occurrences.in_functions.append(enclosing_func(line, column))
             except Exception:  # noqa: BLE001, S110
                 pass
 
+    def __merge(self, other: ZshParser, /) -> None:
+        self.files.extend(other.files)
+        self.functions.extend(other.functions)
+        self.enums.extend(other.enums)
+        self.macros.extend(other.macros)
+        self.typedefs.extend(other.typedefs)
+        self.structs.extend(other.structs)
+        self.unions.extend(other.unions)
+        for option, occurrences in other.option_occurrences.items():
+            self.option_occurrences[option].extend(occurrences)
+        self.errors.extend(other.errors)
+
     def parse(self, file: str) -> None:
         path = self.src_dir / file
-        tu, error = parse_one(self.index, path, self.clang_args, self.src_dir)
+        tu, error = parse_one(get_index(), path, self.clang_args, self.src_dir)
 
         stats = StatsDef()
-        self.files.append(
-            FileDef(
-                path=relpath(path, self.src_dir),
-                parsed=tu is not None,
-                error=error,
-                stats=stats,
-            )
+        file_def = FileDef(
+            path=relpath(path, self.src_dir),
+            parsed=tu is not None,
+            error=error,
+            stats=stats,
         )
+        self.files.append(file_def)
 
         if error or tu is None:
-            if self.verbose:
-                print(f'! Failed to parse {path}: {error}')
             self.errors.append(f'{path.name}: {error}')
+        else:
+            self.__gather(tu, stats)
+
+        self.__report(file_def)
+
+    def __report(self, file: FileDef, /) -> None:
+        if not self.verbose:
             return
 
-        self.__gather(tu, stats)
+        path = self.src_dir / file.path
+        if file.parsed:
+            print(f'\u2713 {path.name}: {file.stats}')
+        else:
+            print(f'! Failed to parse {path}: {file.error}')
+
+    def parse_files(self, files: Sequence[str], /, *, jobs: int = 1) -> None:
+        # Spawning a worker costs an interpreter start and a libclang load, so
+        # never start more than there are files (or any for a single file).
+        jobs = min(jobs, len(files))
+        if jobs <= 1:
+            for file in files:
+                self.parse(file)
+            return
 
-        if self.verbose:
-            print(f'\u2713 {path.name}: {stats}')
+        # Each TU is independent and libclang parsing is CPU bound, so parse in
+        # separate processes (each with its own Index) and merge the results in
+        # the original file order. libclang state does not survive a fork, so
+        # always spawn. Workers stay quiet; progress is reported here, in order.
+        worker_parser = replace(self, verbose=False)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker,
+            initargs=(self.libclang_path,),
+        ) as executor:
+            for parsed in executor.map(parse_file, repeat(worker_parser), files):
+                self.__merge(parsed)
+                for file in parsed.files:
+                    self.__report(file)
 
     def save_syntax(self, out_path: Path, /) -> None:
+        # Sort in place rather than serializing sorted copies
+        by_name = attrgetter('name')
+        self.functions.sort(key=by_name)
+        self.enums.sort(key=by_name)
+        self.macros.sort(key=by_name)
+        self.typedefs.sort(key=name_or_location)
+        self.structs.sort(key=name_or_location)
+        self.unions.sort(key=name_or_location)
+
         doc: dict[str, object] = {
             'meta': {
                 'zsh_version': self.version,
@@ -408,37 +623,13 @@ class ZshParser:
                 else None,
                 'generated_at': datetime.now(UTC).isoformat(),
             },
-            'files': [asdict(file) for file in self.files],
-            'functions': [
-                asdict(func) for func in sorted(self.functions, key=lambda x: x.name)
-            ],
-            'enums': [
-                asdict(enum) for enum in sorted(self.enums, key=lambda x: x.name)
-            ],
-            'macros': [
-                asdict(macro) for macro in sorted(self.macros, key=lambda x: x.name)
-            ],
-            'typedefs': [
-                asdict(td)
-                for td in sorted(
-                    self.typedefs,
-                    key=lambda x: x.name or f'{x.location.file}:{x.location.line}',
-                )
-            ],
-            'structs': [
-                asdict(st)
-                for st in sorted(
-                    self.structs,
-                    key=lambda x: x.name or f'{x.location.file}:{x.location.line}',
-                )
-            ],
-            'unions': [
-                asdict(un)
-                for un in sorted(
-                    self.unions,
-                    key=lambda x: x.name or f'{x.location.file}:{x.location.line}',
-                )
-            ],
+            'files': self.files,
+            'functions': self.functions,
+            'enums': self.enums,
+            'macros': self.macros,
+            'typedefs': self.typedefs,
+            'structs': self.structs,
+            'unions': self.unions,
             'tokens': {
                 'from_enums': sorted(
                     {
@@ -452,12 +643,23 @@ class ZshParser:
                     {macro.name for macro in self.macros if macro.name.isupper()}
                 ),
             },
-            'option_occurrences': self.option_occurrences,
+            'option_occurrences': {
+                option: occurrences.to_json()
+                for option, occurrences in self.option_occurrences.items()
+            },
             'errors': self.errors,
         }
 
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(doc, indent=2, ensure_ascii=False))
+        if orjson is not None:
+            # orjson serializes dataclasses natively and is much faster
+            out_path.write_bytes(orjson.dumps(doc, option=orjson.OPT_INDENT_2))
+            return
+
+        # Stream straight from the dataclasses instead of building an asdict()
+        # copy of everything first
+        with out_path.open('w', encoding='utf-8') as out:
+            json.dump(doc, out, indent=2, ensure_ascii=False, default=json_default)
 
     @classmethod
     def create(cls, args: argparse.Namespace) -> Self:
@@ -472,8 +674,7 @@ class ZshParser:
                 '-I.',
                 f'-I{src_dir}',
                 f'-I{src_dir.parent}',
-                '-std=c99',
-                '-DZSH_VERSION="5.9"',
+                *cls.STATIC_CLANG_ARGS,
             ],
             args.clang,
             args.zsh_version,
@@ -481,6 +682,16 @@ class ZshParser:
         )
 
 
+def init_worker(libclang_path: Path | None, /) -> None:
+    if libclang_path:
+        Config.set_library_file(libclang_path)
+
+
+def parse_file(parser: ZshParser, file: str, /) -> ZshParser:
+    parser.parse(file)
+    return parser
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description='Extract raw zsh source metadata')
     parser.add_argument(
@@ -496,6 +707,12 @@ def main() -> None:
         help='Path to libclang',
     )
     parser.add_argument('--zsh-version', type=str, default='5.9', dest='zsh_version')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of files to parse in parallel',
+    )
     parser.add_argument('--verbose', action='store_true')
 
     args = parser.parse_args()
@@ -520,8 +737,7 @@ def main() -> None:
 
     extractor = ZshParser.create(args)
 
-    for file in c_files:
-        extractor.parse(file)
+    extractor.parse_files(c_files, jobs=args.jobs)
 
     # Save JSON
     extractor.save_syntax(args.out.resolve())